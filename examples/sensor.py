@@ -4,13 +4,23 @@ import asyncio
 
 from meetbopi import BoPiClient
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (`meetbopi[uvloop]`), not on Windows
+    uvloop = None  # type: ignore[assignment]
+
 
 async def main() -> None:
-    """Show example how to get status of your BoPi API."""
+    """Show example how to poll the status of your BoPi API."""
     async with BoPiClient(host="192.168.87.26") as bopi:
-        sensorstate = await bopi.get_sensors_state()
-        print("Ph Value:", sensorstate.phvalue)
+        while True:
+            sensorstate = await bopi.get_sensors_state()
+            print("Ph Value:", sensorstate.phvalue)
+            await asyncio.sleep(5)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import socket
 from typing import TYPE_CHECKING, Any, Self
 
 import aiohttp
+import orjson
 from yarl import URL
 
 from .sensors_state import SensorsState
@@ -30,6 +30,7 @@ class BoPiClient:
     - Connection pooling and session management
     - Comprehensive error handling
     - Request timeout support
+    - Optional conditional GET caching (ETag / Last-Modified)
     """
 
     # pylint: disable-next=too-many-arguments
@@ -40,6 +41,8 @@ class BoPiClient:
         port: int = 80,
         timeout: int = 30,
         session: aiohttp.client.ClientSession | None = None,
+        connector: aiohttp.BaseConnector | None = None,
+        cache: bool = False,
     ) -> None:
         """Initialize connection with BoPi.
 
@@ -52,6 +55,10 @@ class BoPiClient:
             port: Port on which the API runs, usually 80 or 3000.
             timeout: Max timeout to wait for a response from the API in seconds.
             session: Optional, shared, aiohttp client session.
+            connector: Optional aiohttp connector used for the internal
+                session. Ignored when a session is provided.
+            cache: Send conditional GET requests and reuse the previous
+                response when the API answers 304 Not Modified.
 
         Raises:
         ------
@@ -59,7 +66,7 @@ class BoPiClient:
 
         """
         # Validate inputs
-        if not host or not isinstance(host, str):
+        if not isinstance(host, str) or not host:
             msg = "host must be a non-empty string"
             raise BoPiConfigError(msg, field="host")
         if not 1 <= port <= 65535:
@@ -71,6 +78,10 @@ class BoPiClient:
 
         self._session = session
         self._close_session = False
+        self._connector = connector
+        self._cache = cache
+        # full URL (query included) -> (etag, last_modified, raw JSON body)
+        self._cache_entries: dict[str, tuple[str | None, str | None, bytes]] = {}
 
         self.host = host
         self.port = port
@@ -122,25 +133,41 @@ class BoPiClient:
         }
 
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = self._create_session()
             self._close_session = True
 
         skip_auto_headers = None
         if data is None and json_data is None:
             skip_auto_headers = {"Content-Type"}
 
+        cache_key = None
+        if self._cache and method == "GET":
+            cache_key, conditional_headers = self._conditional_headers(url, params)
+            headers.update(conditional_headers)
+
+        # Fail fast on unreachable hosts, while bounding the whole request
+        # (including the body) by self.timeout. sock_connect does not count
+        # time spent waiting for a free pooled connection, so busy pools are
+        # only limited by the total timeout.
+        timeout = aiohttp.ClientTimeout(
+            total=self.timeout,
+            sock_connect=min(self.timeout, 5),
+        )
+
         try:
-            async with asyncio.timeout(self.timeout):
-                response = await self._session.request(
-                    method,
-                    url,
-                    data=data,
-                    json=json_data,
-                    params=params,
-                    headers=headers,
-                    skip_auto_headers=skip_auto_headers,
-                )
+            response = await self._session.request(
+                method,
+                url,
+                data=data,
+                json=json_data,
+                params=params,
+                headers=headers,
+                skip_auto_headers=skip_auto_headers,
+                timeout=timeout,
+            )
 
+            if cache_key is not None:
+                return await self._handle_cached_response(cache_key, response)
             return await self._handle_response(response)
 
         except asyncio.TimeoutError as exception:
@@ -159,6 +186,90 @@ class BoPiClient:
                 response=None,
             ) from exception
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the internal client session.
+
+        The session keeps connections alive between requests, so polling the
+        BoPi API does not pay the connection setup on every call.
+
+        Returns
+        -------
+            A new aiohttp client session.
+
+        """
+        if self._connector is not None:
+            return aiohttp.ClientSession(
+                connector=self._connector, connector_owner=False
+            )
+
+        connector = aiohttp.TCPConnector(
+            limit=10,
+            limit_per_host=4,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    def _conditional_headers(
+        self, url: URL, params: Mapping[str, str] | None
+    ) -> tuple[str, dict[str, str]]:
+        """Build the conditional GET headers for a cacheable request.
+
+        Args:
+        ----
+            url: The request URL.
+            params: Mapping of request parameters sent with the request.
+
+        Returns:
+        -------
+            The key of the request in the response cache and the
+            If-None-Match / If-Modified-Since headers to send, if any.
+
+        """
+        cache_key = str(url.update_query(params) if params else url)
+        headers = {}
+        if cache_key in self._cache_entries:
+            etag, last_modified, _ = self._cache_entries[cache_key]
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return cache_key, headers
+
+    async def _handle_cached_response(
+        self, cache_key: str, response: aiohttp.ClientResponse
+    ) -> dict[str, Any]:
+        """Handle API response for a cacheable request.
+
+        Args:
+        ----
+            cache_key: The key of the request in the response cache.
+            response: The response from the API.
+
+        Returns:
+        -------
+            The cached response on 304 Not Modified, the parsed response
+            otherwise. Cached bodies are decoded again on every hit, so
+            callers get their own copy and may mutate it.
+
+        """
+        if response.status == 304 and cache_key in self._cache_entries:
+            response.release()
+            return orjson.loads(self._cache_entries[cache_key][2])
+
+        result = await self._handle_response(response)
+
+        # Only JSON bodies are kept, as raw bytes (already read, not re-fetched)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        content_type = response.headers.get("Content-Type", "")
+        if (etag or last_modified) and "application/json" in content_type:
+            contents = await response.read()
+            self._cache_entries[cache_key] = (etag, last_modified, contents)
+        else:
+            self._cache_entries.pop(cache_key, None)
+        return result
+
     async def _handle_response(
         self, response: aiohttp.ClientResponse
     ) -> dict[str, Any]:
@@ -178,18 +289,18 @@ class BoPiClient:
 
         """
         content_type = response.headers.get("Content-Type", "")
+        contents = await response.read()
 
         if response.status // 100 in [4, 5]:
-            contents = await response.read()
             response.close()
 
             error_data = None
             try:
                 if content_type == "application/json":
-                    error_data = json.loads(contents.decode("utf8"))
+                    error_data = orjson.loads(contents)
                 else:
                     error_data = {"message": contents.decode("utf8")}
-            except (json.JSONDecodeError, UnicodeDecodeError):
+            except (orjson.JSONDecodeError, UnicodeDecodeError):
                 error_data = {"message": "Unknown error"}
 
             msg = f"API returned error status {response.status}"
@@ -199,12 +310,16 @@ class BoPiClient:
 
         if "application/json" in content_type:
             try:
-                return await response.json()
-            except json.JSONDecodeError as e:
+                return orjson.loads(contents)
+            except orjson.JSONDecodeError as e:
                 msg = f"Failed to parse JSON response: {e}"
                 raise BoPiError(msg) from e
 
-        text = await response.text()
+        try:
+            text = contents.decode(response.charset or "utf-8", "replace")
+        except LookupError:
+            # Unknown charset announced by the server
+            text = contents.decode("utf-8", "replace")
         return {"message": text}
 
     async def close(self) -> None:
@@ -10,10 +10,15 @@ class BoPiError(Exception):
 class BoPiValidationError(BoPiError):
     """Raised when a value from the sensor is invalid."""
 
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         message: str,
         field: str | None = None,
+        *,
+        value: Any = None,
+        min_value: float | None = None,
+        max_value: float | None = None,
     ) -> None:
         """Initialize BoPiValidationError.
 
@@ -21,10 +26,16 @@ class BoPiValidationError(BoPiError):
         ----
             message: Error message.
             field: Field name that failed validation.
+            value: Value that failed validation.
+            min_value: Minimum authorized value, if any.
+            max_value: Maximum authorized value, if any.
 
         """
         self.message = message
         self.field = field
+        self.value = value
+        self.min_value = min_value
+        self.max_value = max_value
         super().__init__(message)
 
     def __str__(self) -> str:
@@ -2,6 +2,9 @@
 
 from .exceptions import BoPiValidationError
 
+# Value reported by the BoPi for a disconnected sensor (-127 == -127.0)
+_DISCONNECTED_SENTINEL: dict[float, None] = {-127: None}
+
 
 def require_range(name: str, value: float, min_v: float, max_v: float) -> None:
     """Validate value range.
@@ -22,11 +25,13 @@ def require_range(name: str, value: float, min_v: float, max_v: float) -> None:
     """
     if not isinstance(value, (int, float)):
         msg = f"{name} must be a number, got {type(value).__name__}"
-        raise BoPiValidationError(msg, field=name)
+        raise BoPiValidationError(msg, field=name, value=value)
 
     if not (min_v <= value <= max_v):
         msg = f"{name} out of range: {value} (expected {min_v}-{max_v})"
-        raise BoPiValidationError(msg, field=name)
+        raise BoPiValidationError(
+            msg, field=name, value=value, min_value=min_v, max_value=max_v
+        )
 
 
 def require_non_negative(name: str, value: int) -> None:
@@ -46,11 +51,11 @@ def require_non_negative(name: str, value: int) -> None:
     """
     if not isinstance(value, int):
         msg = f"{name} must be an integer, got {type(value).__name__}"
-        raise BoPiValidationError(msg, field=name)
+        raise BoPiValidationError(msg, field=name, value=value)
 
     if value < 0:
         msg = f"{name} must be >= 0, got {value}"
-        raise BoPiValidationError(msg, field=name)
+        raise BoPiValidationError(msg, field=name, value=value, min_value=0)
 
 
 def normalize_sensor(value: float | int) -> float | None:
@@ -70,8 +75,4 @@ def normalize_sensor(value: float | int) -> float | None:
     if not isinstance(value, (int, float)):
         return None
 
-    # Check for disconnected sensor value
-    if value == -127:
-        return None
-
-    return float(value)
+    return _DISCONNECTED_SENTINEL.get(value, float(value))
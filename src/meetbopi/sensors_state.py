@@ -2,11 +2,25 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from operator import itemgetter
 from typing import Any
 
 from .helper import normalize_sensor, require_non_negative, require_range
 from .relay import PoolLights, PoolPump, Relay
 
+_required_fields = itemgetter(
+    "boxtemp",
+    "boxhumidity",
+    "mode",
+    "uptime",
+    "poolPump",
+    "poolLights",
+    "relay1",
+    "relay2",
+    "relay3",
+    "relay4",
+)
+
 
 class SensorHealth(str, Enum):
     """Class to handle Sensors Health."""
@@ -110,6 +124,7 @@ class SensorsState:  # pylint: disable=too-many-instance-attributes
         return SensorHealth.DISCONNECTED if self.redoxvalue is None else SensorHealth.OK
 
     @classmethod
+    # pylint: disable-next=too-many-locals
     def from_dict(cls, data: dict[str, Any]) -> "SensorsState":
         """Construct SensorsState from dict.
 
@@ -128,6 +143,19 @@ class SensorsState:  # pylint: disable=too-many-instance-attributes
 
         """
         try:
+            (
+                boxtemp,
+                boxhumidity,
+                mode,
+                uptime,
+                pool_pump,
+                pool_lights,
+                relay1,
+                relay2,
+                relay3,
+                relay4,
+            ) = _required_fields(data)
+
             # Normalize sensors that can be disconnected
             temp1 = normalize_sensor(data.get("temp1", -127))
             temp2 = normalize_sensor(data.get("temp2", -127))
@@ -145,28 +173,28 @@ class SensorsState:  # pylint: disable=too-many-instance-attributes
             if redoxvalue is not None:
                 require_range("redoxvalue", redoxvalue, 0, 1000)
 
-            require_range("boxhumidity", data["boxhumidity"], 0, 100)
-            require_non_negative("uptime", data["uptime"])
+            require_range("boxhumidity", boxhumidity, 0, 100)
+            require_non_negative("uptime", uptime)
 
             return cls(
                 temp1=temp1,
                 temp2=temp2,
-                boxtemp=float(data["boxtemp"]),
-                boxhumidity=data["boxhumidity"],
+                boxtemp=float(boxtemp),
+                boxhumidity=boxhumidity,
                 phvalue=phvalue,
                 redoxvalue=redoxvalue,
-                mode=data["mode"],
-                uptime=data["uptime"],
+                mode=mode,
+                uptime=uptime,
                 lphi=data.get("lphi") or None,
                 tphi=data.get("tphi"),
                 lorpi=data.get("lorpi") or None,
                 torpi=data.get("torpi"),
-                pool_pump=PoolPump.from_dict(data["poolPump"]),
-                pool_lights=PoolLights.from_dict(data["poolLights"]),
-                relay1=Relay.from_dict(data["relay1"]),
-                relay2=Relay.from_dict(data["relay2"]),
-                relay3=Relay.from_dict(data["relay3"]),
-                relay4=Relay.from_dict(data["relay4"]),
+                pool_pump=PoolPump.from_dict(pool_pump),
+                pool_lights=PoolLights.from_dict(pool_lights),
+                relay1=Relay.from_dict(relay1),
+                relay2=Relay.from_dict(relay2),
+                relay3=Relay.from_dict(relay3),
+                relay4=Relay.from_dict(relay4),
             )
         except KeyError as e:
             msg = f"Missing required field in sensor data: {e}"
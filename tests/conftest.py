@@ -0,0 +1,65 @@
+"""Fixtures for the BoPi API client tests."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import aiohttp
+import orjson
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from meetbopi import BoPiClient
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None  # type: ignore[assignment]
+
+# Response bodies are encoded once, not on every request
+OK_JSON = orjson.dumps({"status": "ok", "data": "test"})
+OK_TEXT = b"OK"
+
+
+def pytest_asyncio_loop_factories() -> dict[
+    str, Callable[[], asyncio.AbstractEventLoop]
+]:
+    """Run the test suite on uvloop when it is available."""
+    if uvloop is None:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[aiohttp.ClientSession]:
+    """Return an aiohttp client session, closed after the test."""
+    async with aiohttp.ClientSession() as client_session:
+        yield client_session
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[TestServer]:
+    """Return a local BoPi API test server serving pre-encoded responses."""
+
+    async def json_handler(_: web.Request) -> web.Response:
+        return web.Response(body=OK_JSON, content_type="application/json")
+
+    async def text_handler(_: web.Request) -> web.Response:
+        return web.Response(body=OK_TEXT, content_type="text/plain")
+
+    app = web.Application()
+    app.router.add_get("/json", json_handler)
+    app.router.add_get("/text", text_handler)
+    app.router.add_post("/text", text_handler)
+
+    test_server = TestServer(app)
+    await test_server.start_server()
+    yield test_server
+    await test_server.close()
+
+
+@pytest.fixture
+def bopiclient(server: TestServer, session: aiohttp.ClientSession) -> BoPiClient:
+    """Return a BoPiClient pointed at the local test server."""
+    assert server.port is not None
+    return BoPiClient(server.host, port=server.port, session=session)
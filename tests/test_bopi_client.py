@@ -33,8 +33,41 @@ async def test_invalid_timeout() -> None:
         BoPiClient("example.com", timeout=0)
 
 
-async def test_json_request(aresponses: ResponsesMockServer) -> None:
+async def test_json_request(bopiclient: BoPiClient) -> None:
     """Test JSON response is parsed correctly."""
+    response = await bopiclient.request("/json")
+    assert isinstance(response, dict)
+    assert response["status"] == "ok"
+    assert response["data"] == "test"
+
+
+async def test_text_request(bopiclient: BoPiClient) -> None:
+    """Test non JSON response is handled correctly."""
+    response = await bopiclient.request("/text")
+    assert response == {"message": "OK"}
+
+
+async def test_text_request_unknown_charset(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
+    """Test text response with an unknown charset falls back to UTF-8."""
+    aresponses.add(
+        "example.com",
+        "/",
+        "GET",
+        Response(
+            status=200,
+            headers={"Content-Type": "text/plain; charset=bogus-cs"},
+            body=b"OK",
+        ),
+    )
+    bopiclient = BoPiClient("example.com", session=session)
+    response = await bopiclient.request("/")
+    assert response == {"message": "OK"}
+
+
+async def test_internal_session(aresponses: ResponsesMockServer) -> None:
+    """Test JSON response is handled correctly."""
     aresponses.add(
         "example.com",
         "/",
@@ -42,54 +75,129 @@ async def test_json_request(aresponses: ResponsesMockServer) -> None:
         Response(
             status=200,
             headers={"Content-Type": "application/json"},
-            text='{"status": "ok", "data": "test"}',
+            text='{"status": "ok"}',
         ),
     )
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
+    async with BoPiClient("example.com") as bopiclient:
         response = await bopiclient.request("/")
-        assert isinstance(response, dict)
         assert response["status"] == "ok"
-        assert response["data"] == "test"
-        await bopiclient.close()
 
 
-async def test_text_request(aresponses: ResponsesMockServer) -> None:
-    """Test non JSON response is handled correctly."""
+async def test_internal_session_connector(aresponses: ResponsesMockServer) -> None:
+    """Test the internal session uses the provided connector."""
     aresponses.add("example.com", "/", "GET", Response(status=200, text="OK"))
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
+    connector = aiohttp.TCPConnector()
+    async with BoPiClient("example.com", connector=connector) as bopiclient:
         response = await bopiclient.request("/")
         assert response == {"message": "OK"}
+        assert bopiclient._session is not None
+        assert bopiclient._session.connector is connector
+    assert not connector.closed
+    await connector.close()
 
 
-async def test_internal_session(aresponses: ResponsesMockServer) -> None:
-    """Test JSON response is handled correctly."""
+async def test_conditional_request(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
+    """Test cached response is reused when the API answers 304."""
     aresponses.add(
         "example.com",
         "/",
         "GET",
         Response(
             status=200,
-            headers={"Content-Type": "application/json"},
+            headers={"Content-Type": "application/json", "ETag": '"v1"'},
             text='{"status": "ok"}',
         ),
     )
-    async with BoPiClient("example.com") as bopiclient:
-        response = await bopiclient.request("/")
-        assert response["status"] == "ok"
 
+    async def not_modified_handler(request: aiohttp.web.Request) -> Response:
+        """Response handler for the conditional request."""
+        assert request.headers["If-None-Match"] == '"v1"'
+        return Response(status=304)
+
+    aresponses.add("example.com", "/", "GET", not_modified_handler)
+
+    bopiclient = BoPiClient("example.com", session=session, cache=True)
+    first = await bopiclient.request("/")
+    first["status"] = "mutated"
+    second = await bopiclient.request("/")
+    assert second == {"status": "ok"}
+
+
+async def test_conditional_request_last_modified(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
+    """Test Last-Modified is sent back as If-Modified-Since."""
+    last_modified = "Wed, 14 Oct 2026 10:00:00 GMT"
+    aresponses.add(
+        "example.com",
+        "/",
+        "GET",
+        Response(
+            status=200,
+            headers={
+                "Content-Type": "application/json",
+                "Last-Modified": last_modified,
+            },
+            text='{"status": "ok"}',
+        ),
+    )
+
+    async def not_modified_handler(request: aiohttp.web.Request) -> Response:
+        """Response handler for the conditional request."""
+        assert "If-None-Match" not in request.headers
+        assert request.headers["If-Modified-Since"] == last_modified
+        return Response(status=304)
+
+    aresponses.add("example.com", "/", "GET", not_modified_handler)
+
+    bopiclient = BoPiClient("example.com", session=session, cache=True)
+    assert await bopiclient.request("/") == {"status": "ok"}
+    assert await bopiclient.request("/") == {"status": "ok"}
+
+
+async def test_conditional_request_validators_removed(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
+    """Test cache entry is dropped when the API stops sending validators."""
+    aresponses.add(
+        "example.com",
+        "/",
+        "GET",
+        Response(
+            status=200,
+            headers={"Content-Type": "application/json", "ETag": '"v1"'},
+            text='{"status": "ok"}',
+        ),
+    )
+    aresponses.add(
+        "example.com",
+        "/",
+        "GET",
+        Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"status": "new"}',
+        ),
+    )
+
+    bopiclient = BoPiClient("example.com", session=session, cache=True)
+    await bopiclient.request("/")
+    assert bopiclient._cache_entries
+    assert await bopiclient.request("/") == {"status": "new"}
+    assert not bopiclient._cache_entries
 
-async def test_post_request(aresponses: ResponsesMockServer) -> None:
+
+async def test_post_request(bopiclient: BoPiClient) -> None:
     """Test POST requests are handled correctly."""
-    aresponses.add("example.com", "/", "POST", Response(status=200, text="OK"))
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
-        response = await bopiclient.request("/", method="POST")
-        assert response == {"message": "OK"}
+    response = await bopiclient.request("/text", method="POST")
+    assert response == {"message": "OK"}
 
 
-async def test_request_port(aresponses: ResponsesMockServer) -> None:
+async def test_request_port(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
     """Test BoPi API running on non-standard port."""
     aresponses.add(
         "example.com:3333",
@@ -98,13 +206,14 @@ async def test_request_port(aresponses: ResponsesMockServer) -> None:
         Response(text="SUCCESS", status=200),
     )
 
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", port=3333, session=session)
-        response = await bopiclient.request("/")
-        assert response == {"message": "SUCCESS"}
+    bopiclient = BoPiClient("example.com", port=3333, session=session)
+    response = await bopiclient.request("/")
+    assert response == {"message": "SUCCESS"}
 
 
-async def test_timeout(aresponses: ResponsesMockServer) -> None:
+async def test_timeout(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
     """Test request timeout from BoPi API."""
 
     # Faking a timeout by sleeping
@@ -115,25 +224,25 @@ async def test_timeout(aresponses: ResponsesMockServer) -> None:
 
     aresponses.add("example.com", "/", "GET", response_handler)
 
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session, timeout=1)
-        with pytest.raises(BoPiConnectionError):
-            assert await bopiclient.request("/")
+    bopiclient = BoPiClient("example.com", session=session, timeout=1)
+    with pytest.raises(BoPiConnectionError):
+        assert await bopiclient.request("/")
 
 
-async def test_client_error() -> None:
+async def test_client_error(session: aiohttp.ClientSession) -> None:
     """Test request client error from BoPi API."""
     # Faking a timeout by sleeping
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
-        with (
-            patch.object(session, "request", side_effect=aiohttp.ClientError),
-            pytest.raises(BoPiConnectionError),
-        ):
-            assert await bopiclient.request("/")
+    bopiclient = BoPiClient("example.com", session=session)
+    with (
+        patch.object(session, "request", side_effect=aiohttp.ClientError),
+        pytest.raises(BoPiConnectionError),
+    ):
+        assert await bopiclient.request("/")
 
 
-async def test_http_error_404(aresponses: ResponsesMockServer) -> None:
+async def test_http_error_404(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
     """Test HTTP 404 response raises BoPiError."""
     aresponses.add(
         "example.com",
@@ -142,13 +251,17 @@ async def test_http_error_404(aresponses: ResponsesMockServer) -> None:
         Response(text="Not Found!", status=404),
     )
 
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
-        with pytest.raises(BoPiError, match="API returned error status 404"):
-            await bopiclient.request("/")
+    bopiclient = BoPiClient("example.com", session=session)
+    with pytest.raises(BoPiError, match="API returned error status 404") as exc_info:
+        await bopiclient.request("/")
+    assert isinstance(exc_info.value, BoPiConnectionError)
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.response == {"message": "Not Found!"}
 
 
-async def test_http_error_500(aresponses: ResponsesMockServer) -> None:
+async def test_http_error_500(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
     """Test HTTP 500 response raises BoPiError with JSON error info."""
     aresponses.add(
         "example.com",
@@ -161,13 +274,14 @@ async def test_http_error_500(aresponses: ResponsesMockServer) -> None:
         ),
     )
 
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
-        with pytest.raises(BoPiError, match="API returned error status 500"):
-            await bopiclient.request("/")
+    bopiclient = BoPiClient("example.com", session=session)
+    with pytest.raises(BoPiError, match="API returned error status 500"):
+        await bopiclient.request("/")
 
 
-async def test_http_error_invalid_json(aresponses: ResponsesMockServer) -> None:
+async def test_http_error_invalid_json(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
     """Test HTTP 500 error response with malformed JSON is handled gracefully."""
     aresponses.add(
         "example.com",
@@ -180,13 +294,14 @@ async def test_http_error_invalid_json(aresponses: ResponsesMockServer) -> None:
         ),
     )
 
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
-        with pytest.raises(BoPiError, match="API returned error status 500"):
-            await bopiclient.request("/")
+    bopiclient = BoPiClient("example.com", session=session)
+    with pytest.raises(BoPiError, match="API returned error status 500"):
+        await bopiclient.request("/")
 
 
-async def test_http_success_invalid_json(aresponses: ResponsesMockServer) -> None:
+async def test_http_success_invalid_json(
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
+) -> None:
     """Test HTTP 200 response with malformed JSON raises BoPiError."""
     aresponses.add(
         "example.com",
@@ -199,14 +314,13 @@ async def test_http_success_invalid_json(aresponses: ResponsesMockServer) -> Non
         ),
     )
 
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
-        with pytest.raises(BoPiError, match="Failed to parse JSON response"):
-            await bopiclient.request("/")
+    bopiclient = BoPiClient("example.com", session=session)
+    with pytest.raises(BoPiError, match="Failed to parse JSON response"):
+        await bopiclient.request("/")
 
 
 async def test_get_sensors_state_missing_fields(
-    aresponses: ResponsesMockServer,
+    aresponses: ResponsesMockServer, session: aiohttp.ClientSession
 ) -> None:
     """Test get_sensors_state raises KeyError for missing required fields."""
     aresponses.add(
@@ -220,7 +334,6 @@ async def test_get_sensors_state_missing_fields(
         ),
     )
 
-    async with aiohttp.ClientSession() as session:
-        bopiclient = BoPiClient("example.com", session=session)
-        with pytest.raises(KeyError, match="Missing required field in sensor data"):
-            await bopiclient.get_sensors_state()
+    bopiclient = BoPiClient("example.com", session=session)
+    with pytest.raises(KeyError, match="Missing required field in sensor data"):
+        await bopiclient.get_sensors_state()
@@ -63,6 +63,23 @@ class TestRequireNonNegative:
         with pytest.raises(BoPiValidationError):
             require_non_negative("uptime", -1)
 
+    def test_require_non_negative_error_details(self) -> None:
+        """Test require_non_negative error exposes the failing field and value."""
+        with pytest.raises(BoPiValidationError) as exc_info:
+            require_non_negative("uptime", -1)
+        assert exc_info.value.field == "uptime"
+        assert exc_info.value.value == -1
+        assert exc_info.value.min_value == 0
+        assert exc_info.value.max_value is None
+
+    def test_require_non_negative_type_error_details(self) -> None:
+        """Test require_non_negative type error exposes the failing value."""
+        with pytest.raises(BoPiValidationError) as exc_info:
+            require_non_negative("uptime", "1")  # type: ignore[arg-type]
+        assert exc_info.value.field == "uptime"
+        assert exc_info.value.value == "1"
+        assert exc_info.value.min_value is None
+
 
 class TestRequireRange:
     """Tests for require_range function."""
@@ -97,6 +114,15 @@ class TestRequireRange:
         with pytest.raises(BoPiValidationError):
             require_range("phvalue", 15.0, 0.0, 14.0)
 
+    def test_require_range_error_details(self) -> None:
+        """Test require_range error exposes the failing field and value."""
+        with pytest.raises(BoPiValidationError) as exc_info:
+            require_range("phvalue", 15.0, 0.0, 14.0)
+        assert exc_info.value.field == "phvalue"
+        assert exc_info.value.value == 15.0
+        assert exc_info.value.min_value == 0.0
+        assert exc_info.value.max_value == 14.0
+
     def test_require_range_humidity(self) -> None:
         """Test require_range with humidity percentage."""
         # Should not raise
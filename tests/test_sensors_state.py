@@ -0,0 +1,64 @@
+"""Tests for `bopi.sensors_state`."""
+
+from typing import Any
+
+from meetbopi.sensors_state import SensorHealth, SensorsState
+
+
+def relay(role: str) -> dict[str, Any]:
+    """Return relay data with a distinct role."""
+    return {"status": 1, "override": 0, "timeleft": 0, "role": role}
+
+
+SENSORS_DATA: dict[str, Any] = {
+    "temp1": 24.5,
+    "temp2": -127,
+    "boxtemp": 31,
+    "boxhumidity": 42,
+    "phvalue": 7.2,
+    "redoxvalue": 650,
+    "mode": 2,
+    "uptime": 3600,
+    "lphi": "",
+    "tphi": 5,
+    "lorpi": "orp",
+    "torpi": 10,
+    "poolPump": {"status": 1, "override": 1, "timeleft": 120},
+    "poolLights": {"status": 0, "timeleft": 30},
+    "relay1": relay("heater"),
+    "relay2": relay("chlorinator"),
+    "relay3": relay("ph-"),
+    "relay4": relay("lights"),
+}
+
+
+def test_from_dict() -> None:
+    """Test every field is mapped from the matching payload key."""
+    state = SensorsState.from_dict(SENSORS_DATA)
+
+    assert state.temp1 == 24.5
+    assert state.temp2 is None
+    assert state.boxtemp == 31.0
+    assert state.boxhumidity == 42
+    assert state.phvalue == 7.2
+    assert state.redoxvalue == 650
+    assert state.mode == 2
+    assert state.uptime == 3600
+    assert state.lphi is None
+    assert state.tphi == 5
+    assert state.lorpi == "orp"
+    assert state.torpi == 10
+
+    assert state.pool_pump.status is True
+    assert state.pool_pump.override == 1
+    assert state.pool_pump.timeleft == 120
+    assert state.pool_lights.status is False
+    assert state.pool_lights.timeleft == 30
+
+    assert state.relay1.role == "heater"
+    assert state.relay2.role == "chlorinator"
+    assert state.relay3.role == "ph-"
+    assert state.relay4.role == "lights"
+
+    assert state.temp1_health == SensorHealth.OK
+    assert state.temp2_health == SensorHealth.DISCONNECTED